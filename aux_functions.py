@@ -3,29 +3,39 @@ import os
 import re
 import json
 import shutil
+import bisect
+import functools
 import subprocess
+import sys
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, NamedTuple, Iterator
+
+try:
+    import fcntl   # POSIX only; used for reflink copies on Linux
+except ImportError:
+    fcntl = None
 
 # ------------------------------------------------------------
 # ASCII-only, single-line progress bar (no ANSI escape codes)
 # ------------------------------------------------------------
 
 
-def progress_bar(iterable, prefix='', suffix='', decimals=1, length=40, fill='█'):
-    items = list(iterable)
-    total = len(items)
+def progress_bar(iterable, total, prefix='', suffix='', decimals=1, length=40, fill='█'):
+    # Streams `iterable` as-is; `total` comes from the caller (None: show a count only)
     def render(i):
+        if total is None:
+            print(f"\r{prefix} {i} {suffix}", end='', flush=True)
+            return
         if total == 0:
             percent = f"{100:.{decimals}f}"
             filled = length
         else:
             percent = f"{(100 * i / float(total)):.{decimals}f}"
-            filled = int(length * i // total)
+            filled = min(length, int(length * i // total))
         bar = fill * filled + '-' * (length - filled)
         print(f"\r{prefix} [{bar}] {percent}% {suffix}", end='', flush=True)
     render(0)
-    for i, item in enumerate(items, 1):
+    for i, item in enumerate(iterable, 1):
         yield item
         render(i)
     print()
@@ -36,10 +46,12 @@ def progress_bar(iterable, prefix='', suffix='', decimals=1, length=40, fill='
 # ------------------------------------------------------------
 
 # Catch more Takeout sidecar variants: supplemental-metadata, suppl, supp, and stray counters
+# (compiled once at import, like every pattern used on the per-sidecar path)
 SIDE_SUFFIX_RE = re.compile(
     r"\.(supplemental\-metadata|supp\-metadata|suppl|supp)(\(\d+\))?$",
     re.IGNORECASE
 )
+_DOT_COLLAPSE_RE = re.compile(r"\.+")
 
 def sanitize_json_title(base: str) -> str:
     """
@@ -50,8 +62,8 @@ def sanitize_json_title(base: str) -> str:
       - keep only ASCII-safe punctuation (handled by fix_title)
     """
     s = strip_json_suffix(fix_title(base))
-    s = re.sub(r"\.+", ".", s)   # collapse ".." -> "."
-    s = s.rstrip(".")            # remove trailing dot(s)
+    s = _DOT_COLLAPSE_RE.sub(".", s)   # collapse ".." -> "."
+    s = s.rstrip(".")                  # remove trailing dot(s)
     return s
 
 def strip_json_suffix(base: str) -> str:
@@ -70,10 +82,24 @@ ISO_BRANDS_MOV  = {b"qt  ", b"pnot"}
 ISO_BRANDS_MP4  = {b"isom", b"mp41", b"mp42", b"avc1"}
 
 
+def _read_header(path: str, size: int = 32) -> bytes:
+    # Raw fd instead of open(): skips the buffered-reader setup (fstat, isatty, lseek)
+    # so a sniff is just open/read/close
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            return os.pread(fd, size, 0)
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+# Each media file is sniffed from several places (resolver fallback, output naming,
+# Live Photo check, ExifTool args); cache per path so it's opened only once.
+# Output paths are always new files, so a cached entry never goes stale within a run.
+@functools.lru_cache(maxsize=16384)
 def sniff_type(path: str) -> Optional[Tuple[str, str]]:
     try:
-        with open(path, 'rb') as f:
-            header = f.read(32)
+        header = _read_header(path)
     except Exception:
         return None
     if not header:
@@ -98,31 +124,74 @@ def sniff_type(path: str) -> Optional[Tuple[str, str]]:
 # ------------------------------------------------------------
 
 def collapse_extensions(name: str) -> Tuple[str, str]:
-    base = name
-    last_ext = ''
-    while True:
-        b, e = os.path.splitext(base)
-        if e:
-            base = b
-            last_ext = e
-            continue
-        break
-    return base, last_ext
+    """
+    Split "IMG.heic.jpeg" into ("IMG", ".jpeg"): base up to the first dot,
+    plus the last extension. Leading dots belong to the base, as in splitext.
+    """
+    start = len(name) - len(name.lstrip('.'))
+    first = name.find('.', start)
+    if first == -1:
+        return name, ''
+    return name[:first], name[name.rfind('.'):]
+
+# Characters Takeout drops from titles; stripped in a single str.translate pass
+_TITLE_STRIP_CHARS = "%<>=:?¿*#&{}\n@!+\"'"
+_TITLE_TRANSLATE = str.maketrans('', '', _TITLE_STRIP_CHARS)
+_WS_RE = re.compile(r"\s{2,}")
 
 def fix_title(title: str) -> str:
-    cleaned = str(title)
-    for ch in ["%","<",">","=",":","?","¿","*","#","&","{","}","\n","@","!","+","\n","\"","'"]:
-        cleaned = cleaned.replace(ch, "")
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
-    return cleaned
+    cleaned = str(title).translate(_TITLE_TRANSLATE)
+    return _WS_RE.sub(" ", cleaned).strip()
 
 # ------------------------------------------------------------
 # Media resolver (JSON -> actual file)
 # ------------------------------------------------------------
 
-def search_media(path: str, title: str, edited_word: str) -> Optional[str]:
+# Known media extensions to try, in match order (you can drop videos if you only care about photos)
+MEDIA_EXTS = ["heic", "jpg", "jpeg", "png", "tif", "tiff", "mov", "mp4", "m4v"]
+# " (n).ext" / "(n).ext" after a stem; matched from the end of the stem
+_DUPLICATE_SUFFIX_RE = re.compile(rf" ?\((\d+)\)\.({'|'.join(MEDIA_EXTS)})$")
+
+class DirIndex(NamedTuple):
+    lowered: Dict[str, List[os.DirEntry]]   # casefolded file name -> DirEntries spelled that way
+    names: List[str]                        # sorted keys of `lowered`, for prefix range scans
+
+def index_directory(entries: List[os.DirEntry]) -> DirIndex:
     """
-    Robust resolver for weird JSON basenames:
+    Case-insensitive index of the files in one directory listing.
+    Names that differ only in case (case-sensitive filesystems) share one key.
+    Built once per directory and shared by every JSON resolved in it.
+    """
+    lowered: Dict[str, List[os.DirEntry]] = {}
+    for e in entries:
+        if e.is_file():
+            lowered.setdefault(e.name.casefold(), []).append(e)
+    return DirIndex(lowered, sorted(lowered))
+
+def iter_prefixed(index: DirIndex, prefix_cf: str) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """
+    Yield (casefolded name, DirEntries) for the files whose name starts with
+    `prefix_cf`, in sorted order. Bisects into the sorted names instead of
+    scanning the whole directory.
+    """
+    names = index.names
+    i = bisect.bisect_left(names, prefix_cf)
+    while i < len(names) and names[i].startswith(prefix_cf):
+        yield names[i], index.lowered[names[i]]
+        i += 1
+
+def _pick(hits: List[os.DirEntry], name: str) -> os.DirEntry:
+    """Of the files sharing one casefolded key, prefer the one spelled exactly `name`."""
+    if len(hits) > 1:
+        for e in hits:
+            if e.name == name:
+                return e
+    return hits[0]
+
+def search_media(index: DirIndex, title: str, edited_word: str) -> Optional[str]:
+    """
+    Robust resolver for weird JSON basenames, matched against the directory
+    index from index_directory (no filesystem access besides header sniffs):
       - normalizes the title
       - tries common media extensions (jpeg/jpg/heic/png/tiff; optionally mov/mp4/m4v)
       - supports edited suffix patterns and (n) duplicates
@@ -133,61 +202,70 @@ def search_media(path: str, title: str, edited_word: str) -> Optional[str]:
 
     # Split, but DO NOT trust this "ext" as the real media ext
     file_name, json_ext = os.path.splitext(title)
+    base_cf = file_name.casefold()
 
-    # Known media extensions to try (you can drop videos if you only care about photos)
-    media_exts = ["heic", "jpg", "jpeg", "png", "tif", "tiff", "mov", "mp4", "m4v"]
-
-    # Build candidate names across all media_exts
-    candidates: List[str] = []
-    def add_variants(stem: str, ext: str):
-        dotext = "." + ext
-        candidates.extend([
-            stem + dotext,                          # plain
-            f"{stem}-{edited_word}{dotext}",        # -edited
-            f"{stem}-{edited_word.upper()}{dotext}",# -EDITED
-            f"{stem} - {edited_word}{dotext}",      # " - edited"
-            f"{stem} ({edited_word}){dotext}",      # " (edited)"
-            f"{stem}(1){dotext}",                   # duplicate (1)
-            f"{stem} (1){dotext}",                  # " (1)"
-        ])
-        for n in range(2, 21):
-            candidates.append(f"{stem}({n}){dotext}")
-            candidates.append(f"{stem} ({n}){dotext}")
+    # Early out: every candidate starts with the stem, and one bisect into the
+    # sorted names tells whether any file in the directory does
+    if next(iter_prefixed(index, base_cf), None) is None:
+        return None
+    lowered = index.lowered
+
+    media_exts = MEDIA_EXTS
+
+    # Stem variants are built (and casefolded) once per stem, then crossed with
+    # media_exts at lookup time; the search stops at the first hit in the index.
+    # The original spelling is kept to pick among names differing only in case
+    def stem_variants(stem: str) -> List[Tuple[str, str]]:
+        return [(v, v.casefold()) for v in (
+            stem,                               # plain
+            f"{stem}-{edited_word}",            # -edited (also -EDITED: lookups are casefolded)
+            f"{stem} - {edited_word}",          # " - edited"
+            f"{stem} ({edited_word})",          # " (edited)"
+        )]
+
+    # Duplicates "stem(n).ext" / "stem (n).ext": one pass of the shared suffix
+    # pattern over the names starting with stem instead of enumerating every n.
+    # Keeps the best match per ext, ranked like the old enumeration: lowest n,
+    # then "(n)" before " (n)"
+    def find_duplicates(stem: str) -> Dict[str, os.DirEntry]:
+        stem_cf = stem.casefold()
+        best = {}
+        for name, hits in iter_prefixed(index, stem_cf):
+            m = _DUPLICATE_SUFFIX_RE.match(name, len(stem_cf))
+            if m:
+                rank = (int(m.group(1)), name[len(stem_cf)] == " ")
+                ext = m.group(2)
+                if ext not in best or rank < best[ext][0]:
+                    best[ext] = (rank, _pick(hits, stem + name[len(stem_cf):]))
+        return {ext: entry for ext, (_, entry) in best.items()}
 
     # First: exact "stem" from sanitized title
-    for ext in media_exts:
-        add_variants(file_name, ext)
+    stems = [file_name]
 
     # Also try the raw sanitized title as a whole + ext list if the stem itself includes a sub-ext (e.g., "...IMG_3063.h")
     # This catches cases like "....IMG_3063.h.json" → "...IMG_3063.h.jpeg"
     if json_ext and json_ext[1:].lower() not in media_exts:
-        for ext in media_exts:
-            add_variants(title, ext)
+        stems.append(title)
 
-    # Fast path: exact case on disk
-    for cand in candidates:
-        fp = os.path.join(path, cand)
-        if os.path.exists(fp):
-            return fp
-
-    # Case-insensitive map of directory files
-    try:
-        entries = {e.name.casefold(): e.path for e in os.scandir(path) if e.is_file()}
-    except FileNotFoundError:
-        return None
-
-    for cand in candidates:
-        p = entries.get(cand.casefold())
-        if p:
-            return p
+    # One case-insensitive dict lookup per candidate, no stat calls; per ext the
+    # plain and edited names come first, then that ext's duplicates
+    for stem in stems:
+        variants = stem_variants(stem)
+        dups = None
+        for ext in media_exts:
+            dotext = "." + ext
+            for v, v_cf in variants:
+                hits = lowered.get(v_cf + dotext)
+                if hits:
+                    return _pick(hits, v + dotext).path
+            if dups is None:
+                dups = find_duplicates(stem)
+            if ext in dups:
+                return dups[ext].path
 
     # Fallback: prefix scan + header sniff (handles missing-ext JSON like "...97.json")
-    base_cf = file_name.casefold()
-    for e in os.scandir(path):
-        if not e.is_file():
-            continue
-        name_cf = e.name.casefold()
-        if name_cf.startswith(base_cf):
+    for _, hits in iter_prefixed(index, base_cf):
+        for e in hits:
             t = sniff_type(e.path)
             if t and t[0] in ("jpeg", "png", "tiff", "heic", "mov", "mp4"):
                 return e.path
@@ -199,40 +277,29 @@ def search_media(path: str, title: str, edited_word: str) -> Optional[str]:
 # Live Photo partner finder (image -> video)
 # ------------------------------------------------------------
 
-def find_live_video_partner(folder: str, image_basestem: str) -> Optional[str]:
+def find_live_video_partner(index: DirIndex, image_basestem: str) -> Optional[str]:
     """
-    Try to locate a Live Photo video partner next to an image.
-    We consider:
+    Try to locate a Live Photo video partner next to an image, using the
+    directory index of the image's folder (no extra scandir).
+    We consider (case-insensitively):
       - extensionless file with the same stem (e.g., 'IMG_0052')
-      - typical video extensions: .mov/.MOV/.mp4/.MP4/.m4v
+      - typical video extensions: .mov/.mp4/.m4v
     We confirm by sniffing the header.
     Returns the absolute path to the partner video, or None.
     """
-    candidates = [
-        os.path.join(folder, image_basestem),
-        os.path.join(folder, image_basestem + ".mov"),
-        os.path.join(folder, image_basestem + ".MOV"),
-        os.path.join(folder, image_basestem + ".mp4"),
-        os.path.join(folder, image_basestem + ".MP4"),
-        os.path.join(folder, image_basestem + ".m4v"),
-    ]
-    for c in candidates:
-        if os.path.exists(c):
-            t = sniff_type(c)
+    for name in (image_basestem, image_basestem + ".mov", image_basestem + ".mp4", image_basestem + ".m4v"):
+        hits = index.lowered.get(name.casefold(), [])
+        # the exact spelling first, then names differing from it only in case
+        for e in sorted(hits, key=lambda e: e.name != name):
+            t = sniff_type(e.path)
             if t and t[0] in ("mov", "mp4"):
-                return c
-    # Fallback: scan directory for files that start with stem
-    try:
-        for e in os.scandir(folder):
-            if not e.is_file():
-                continue
-            name = e.name
-            if name == image_basestem or name.startswith(image_basestem + "."):
-                t = sniff_type(e.path)
-                if t and t[0] in ("mov", "mp4"):
-                    return e.path
-    except FileNotFoundError:
-        pass
+                return e.path
+    # Fallback: any other file named "stem.<something>"
+    for _, hits in iter_prefixed(index, image_basestem.casefold() + "."):
+        for e in hits:
+            t = sniff_type(e.path)
+            if t and t[0] in ("mov", "mp4"):
+                return e.path
     return None
 
 # ------------------------------------------------------------
@@ -267,7 +334,7 @@ def extract_metadata(json_path: str) -> dict:
 def fmt_ts(ts: int) -> str:
     return datetime.fromtimestamp(ts).strftime('%Y:%m:%d %H:%M:%S')
 
-def build_exiftool_args(target_path: str, meta: dict) -> List[str]:
+def build_exiftool_args(target_path: str, meta: dict, kind: Optional[Tuple[str, str]] = None) -> List[str]:
     ts = meta.get('timestamp')
     lat = meta.get('latitude')
     lon = meta.get('longitude')
@@ -292,19 +359,170 @@ def build_exiftool_args(target_path: str, meta: dict) -> List[str]:
         args += [f"-GPSLatitude={lat}", f"-GPSLongitude={lon}"]
     if valid_num(alt):
         args += [f"-GPSAltitude={alt}"]
-    kind = sniff_type(target_path)
+    if kind is None:
+        kind = sniff_type(target_path)
     if kind and kind[0] in ("mov", "mp4"):
         args = ["-api", "QuickTimeUTC=1"] + args
     return args
 
 
+EXIFTOOL_NOT_FOUND = "exiftool not found. Install it and ensure it's in PATH."
+
+
+class ExifToolDaemon:
+    """
+    One long-lived `exiftool -stay_open True -@ -` process.
+    execute_many() streams each argument set (one arg per line) followed by -execute
+    and reads back until the matching {readyN} marker, so ExifTool's startup cost
+    is paid once per run instead of once per file.
+    Arguments are written as raw filesystem bytes (os.fsencode), so names that
+    aren't valid UTF-8 reach ExifTool unchanged. An argfile line can't carry every
+    argument though; check accepts() and send the rest through run_exiftool.
+    If the process dies, the command in flight fails and the next one starts a
+    fresh process. Use as a context manager; if exiftool is missing, every
+    command reports rc 127.
+    """
+
+    def __init__(self, executable: str = "exiftool"):
+        self.executable = executable
+        self.proc: Optional[subprocess.Popen] = None
+        self.not_found = False
+        self._start_error = ""
+        self._seq = 0
+
+    def __enter__(self) -> "ExifToolDaemon":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def start(self) -> "ExifToolDaemon":
+        try:
+            self.proc = subprocess.Popen(
+                [self.executable, "-stay_open", "True", "-@", "-",
+                 "-common_args", "-charset", "filename=utf8"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            self.proc = None
+            self.not_found = True
+        except OSError as e:
+            self.proc = None
+            self._start_error = f"could not start exiftool: {e}"
+        return self
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.write(b"-stay_open\nFalse\n")
+            self.proc.stdin.flush()
+        except OSError:
+            pass
+        try:
+            self.proc.communicate(timeout=30)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.proc.kill()
+        self.proc = None
+
+    @staticmethod
+    def accepts(args: List[str]) -> bool:
+        """
+        True if every arg survives as one argfile line: ExifTool splits on
+        newlines, strips surrounding whitespace and skips lines starting with '#'.
+        """
+        return not any(
+            "\n" in a or "\r" in a or a != a.strip() or a.startswith("#")
+            for a in args
+        )
+
+    def execute_many(self, commands: List[List[str]]) -> List[Tuple[int, str]]:
+        """
+        Send several commands in one write, each as its own -execute group (so
+        they can use different options), and return their results in order.
+        A process that died is restarted for the commands after the one that
+        was in flight.
+        """
+        results: List[Tuple[int, str]] = []
+        while len(results) < len(commands):
+            if self.proc is None and not self.not_found:
+                self.start()
+            if self.proc is None:
+                failure = (127, EXIFTOOL_NOT_FOUND) if self.not_found else (1, self._start_error)
+                results += [failure] * (len(commands) - len(results))
+                break
+            results += self._run_batch(commands[len(results):])
+        return results
+
+    def _run_batch(self, commands: List[List[str]]) -> List[Tuple[int, str]]:
+        """
+        One write for the whole batch, then read each result in order. Stops at
+        the first command the process didn't answer; that one is reported failed.
+        """
+        markers = []
+        lines: List[str] = []
+        for args in commands:
+            self._seq += 1
+            ready = f"{{ready{self._seq}}}"
+            markers.append(ready)
+            # -echo3 reports the command's exit status on stdout; -echo4 marks the end of stderr
+            lines += args + ["-echo3", "${status}", "-echo4", ready, f"-execute{self._seq}"]
+        try:
+            self.proc.stdin.write(b"\n".join(os.fsencode(a) for a in lines) + b"\n")
+            self.proc.stdin.flush()
+        except OSError as e:
+            self._discard()
+            return [(1, f"exiftool exited unexpectedly: {e}")]
+        results = []
+        for ready in markers:
+            out = self._read_until(self.proc.stdout, ready)
+            err = self._read_until(self.proc.stderr, ready) if out is not None else None
+            if out is None or err is None:
+                self._discard()
+                results.append((1, "".join(out or []) + "".join(err or []) + "exiftool exited unexpectedly."))
+                break
+            status = out[-1].strip() if out else ''
+            if status.isdigit():
+                rc = int(status)
+                out = out[:-1]
+            else:
+                # ExifTool too old for ${status}: infer from stderr
+                rc = 1 if any(line.startswith("Error") for line in err) else 0
+            results.append((rc, "".join(out) + "".join(err)))
+        return results
+
+    def _discard(self) -> None:
+        """Kill and reap a dead or wedged process so the next command starts a fresh one."""
+        proc, self.proc = self.proc, None
+        proc.kill()
+        proc.wait()
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _read_until(stream, marker: str) -> Optional[List[str]]:
+        lines: List[str] = []
+        while True:
+            line = stream.readline().decode("utf-8", errors="replace")
+            if not line:
+                return None
+            if line.rstrip("\r\n") == marker:
+                return lines
+            lines.append(line)
+
+
 def run_exiftool(args: List[str], target: str) -> Tuple[int, str]:
     cmd = ["exiftool"] + args + [target]
     try:
         p = subprocess.run(cmd, capture_output=True, text=True)
         return p.returncode, (p.stdout + p.stderr)
     except FileNotFoundError:
-        return 127, "exiftool not found. Install it and ensure it's in PATH."
+        return 127, EXIFTOOL_NOT_FOUND
 
 
 # ------------------------------------------------------------
@@ -316,41 +534,60 @@ def set_fs_times_fallback(path: str, timestamp: int) -> None:
     Note: true 'Created' time is platform-dependent; ExifTool sets it when possible.
     """
     try:
-        dt = datetime.fromtimestamp(timestamp)
-        mod = dt.timestamp()
+        ns = int(timestamp) * 1_000_000_000
         # atime = mod as well (to keep them aligned)
-        os.utime(path, (mod, mod))
+        os.utime(path, ns=(ns, ns))
     except Exception:
         pass
 
 # ------------------------------------------------------------
 # Apply metadata + filesystem timestamps (one-stop)
 # ------------------------------------------------------------
-def apply_metadata_and_fs_times(target_path: str, meta: dict) -> Tuple[int, str]:
+def apply_metadata_and_fs_times(target_paths: List[str], meta: dict, et: Optional[ExifToolDaemon] = None,
+                                kinds: Optional[List[Optional[Tuple[str, str]]]] = None) -> List[Tuple[int, str]]:
     """
-    1) Build and run ExifTool write (lossless).
+    1) Build and run ExifTool writes (lossless) for all targets sharing `meta`,
+       e.g. a Live Photo image and its video. With `et` they go out in one round
+       trip, one -execute group per target (videos need QuickTimeUTC, images don't).
+       `kinds` are the sniffed types of the sources; the copies have the same
+       bytes, so passing them saves re-reading the output headers.
     2) Ensure filesystem timestamps match the photo/video timestamp.
        - ExifTool args already include FileCreateDate/FileModifyDate.
        - If ExifTool fails or the tag isn't applied, we still set via os.utime fallback.
-    Returns: (rc, combined_log)
+    Returns: [(rc, combined_log)] per target, in order
     """
-    args = build_exiftool_args(target_path, meta)
-    rc, log = run_exiftool(args, target_path)
+    if kinds is None:
+        kinds = [None] * len(target_paths)
+    jobs = [(build_exiftool_args(t, meta, k), t) for t, k in zip(target_paths, kinds)]
+    results: List[Optional[Tuple[int, str]]] = [None] * len(jobs)
+    if et is not None:
+        # Absolute paths never start with whitespace or '#', and don't depend on
+        # the daemon's working directory
+        batch = [(i, args + [os.path.abspath(t)]) for i, (args, t) in enumerate(jobs)]
+        batch = [(i, cmd) for i, cmd in batch if et.accepts(cmd)]
+        for (i, _), res in zip(batch, et.execute_many([cmd for _, cmd in batch])):
+            results[i] = res
+    # Without a daemon, or for args the argfile can't carry, one exiftool per target
+    for i, (args, t) in enumerate(jobs):
+        if results[i] is None:
+            results[i] = run_exiftool(args, t)
 
     # Always set filesystem timestamps if we have a JSON timestamp
     ts = meta.get("timestamp")
     if ts:
         # Even if ExifTool succeeded, keep a fallback write to be extra-safe on PNG/edge cases
-        set_fs_times_fallback(target_path, ts)
+        for t in target_paths:
+            set_fs_times_fallback(t, ts)
 
-    return rc, log
+    return results
 
 
 # ------------------------------------------------------------
 # Output-only normalization and copy
 # ------------------------------------------------------------
 
-def compute_normalized_output(root_folder: str, out_folder: str, media_path: str) -> str:
+def normalized_output_name(root_folder: str, out_folder: str, media_path: str) -> Tuple[str, str]:
+    """Return (out_dir, desired_name) for media_path, creating out_dir."""
     src_dir = os.path.dirname(media_path)
     rel_dir = os.path.relpath(src_dir, root_folder)
     base_name = os.path.basename(media_path)
@@ -363,6 +600,11 @@ def compute_normalized_output(root_folder: str, out_folder: str, media_path: str
     desired_name = f"{base}.{target_ext}" if target_ext else base
     out_dir = os.path.join(out_folder, rel_dir)
     os.makedirs(out_dir, exist_ok=True)
+    return out_dir, desired_name
+
+
+def free_output_path(out_dir: str, desired_name: str) -> str:
+    """First of name, name(1), name(2), ... that doesn't exist in out_dir yet."""
     dst = os.path.join(out_dir, desired_name)
     if os.path.exists(dst):
         stem, ext = os.path.splitext(desired_name)
@@ -375,8 +617,72 @@ def compute_normalized_output(root_folder: str, out_folder: str, media_path: str
     return dst
 
 
+def compute_normalized_output(root_folder: str, out_folder: str, media_path: str) -> str:
+    return free_output_path(*normalized_output_name(root_folder, out_folder, media_path))
+
+
+def reserve_output_path(root_folder: str, out_folder: str, media_path: str) -> str:
+    """
+    Pick the normalized output path for media_path and claim it with an empty
+    file (exclusive create), so later picks see it as taken before the copy runs.
+    """
+    out_dir, desired_name = normalized_output_name(root_folder, out_folder, media_path)
+    while True:
+        dst = free_output_path(out_dir, desired_name)
+        try:
+            open(dst, 'xb').close()
+            return dst
+        except FileExistsError:
+            # created by someone else between the probe and the create
+            continue
+
+
+FICLONE = 0x40049409   # Linux ioctl: share the source's extents (btrfs/xfs reflink)
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+def _copy_range(src_fd: int, dst_fd: int) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    remaining = os.fstat(src_fd).st_size
+    try:
+        while remaining > 0:
+            n = os.copy_file_range(src_fd, dst_fd, remaining)
+            if n == 0:
+                # Some filesystems (procfs, FUSE, overlay, ecryptfs) report 0 without
+                # copying anything; treat it, and any short copy, as unsupported
+                break
+            remaining -= n
+    except OSError:
+        return False
+    return remaining <= 0
+
+def fast_copy(src: str, dst: str) -> None:
+    """
+    Copy src -> dst as cheaply as the platform allows, then copy its metadata
+    like shutil.copy2:
+      1) FICLONE reflink (copy-on-write, no data moved)
+      2) os.copy_file_range (in-kernel copy)
+      3) shutil.copyfile (sendfile / fcopyfile / read-write loop)
+    """
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            done = _reflink(fsrc.fileno(), fdst.fileno()) or _copy_range(fsrc.fileno(), fdst.fileno())
+    except OSError:
+        done = False
+    if not done:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 def copy_media_to_output(root_folder: str, out_folder: str, media_path: str) -> str:
-    dst = compute_normalized_output(root_folder, out_folder, media_path)
-    if not os.path.exists(dst):
-        shutil.copy2(media_path, dst)
+    dst = reserve_output_path(root_folder, out_folder, media_path)
+    fast_copy(media_path, dst)
     return dst
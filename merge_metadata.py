@@ -3,10 +3,19 @@ import os
 import argparse
 from process_folder import process_folder
 
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return n
+
+
 parser = argparse.ArgumentParser(description='Lossless Google Takeout metadata merger (ExifTool) with built-in output normalization + Live Photo linking')
 parser.add_argument('source_folder', help='Root folder of Google Photos Takeout')
 parser.add_argument('output_folder', help='Destination folder for normalized media with embedded metadata')
 parser.add_argument('-w', '--edited_word', default='edited', help="Google Photos 'edited' suffix (default: edited)")
+parser.add_argument('-j', '--workers', type=positive_int, default=None, help='Parallel workers (default: 2x CPU count)')
 args = parser.parse_args()
 
 if not os.path.exists(args.source_folder):
@@ -15,4 +24,4 @@ if not os.path.exists(args.source_folder):
 
 os.makedirs(args.output_folder, exist_ok=True)
 
-process_folder(args.source_folder, args.edited_word, args.output_folder)
+process_folder(args.source_folder, args.edited_word, args.output_folder, args.workers)
@@ -1,79 +1,193 @@
 
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from aux_functions import (
     progress_bar,
+    DirIndex,
+    index_directory,
     search_media,
     extract_metadata,
     apply_metadata_and_fs_times,
-    copy_media_to_output,
+    reserve_output_path,
+    fast_copy,
     sniff_type,
     find_live_video_partner,
+    ExifToolDaemon,
 )
 
 EXCLUDE_JSON_BASE = {"metadata", "shared_album_comments"}
 
 
-def get_sidecars(folder: str, edited_word: str):
-    pairs = []
-    for entry in os.scandir(folder):
+def _sidecar_base(entry: os.DirEntry):
+    """Return the JSON basename if `entry` is a Takeout sidecar, else None."""
+    name = entry.name
+    # Suffix test first: most entries are media, and this skips splitext for them
+    if len(name) <= 5 or name[-5:].lower() != ".json" or not entry.is_file():
+        return None
+    base = name[:-5]
+    if base in EXCLUDE_JSON_BASE:
+        return None
+    return base
+
+
+def count_sidecars(folder: str) -> int:
+    """Cheap first pass: count sidecars without resolving their media."""
+    total = 0
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir():
+                total += count_sidecars(entry.path)
+            elif _sidecar_base(entry) is not None:
+                total += 1
+    return total
+
+
+def iter_sidecars(folder: str, edited_word: str):
+    """
+    Yield (json_path, media_path, dir_index) lazily. Each directory is read once;
+    its JSONs are matched against that same listing before recursing, and the
+    index is passed along for the Live Photo lookup.
+    """
+    with os.scandir(folder) as it:
+        entries = list(it)
+    index = index_directory(entries)
+    subdirs = []
+    for entry in entries:
         if entry.is_dir():
-            pairs += get_sidecars(entry.path, edited_word)
-        elif entry.is_file():
-            base, ext = os.path.splitext(entry.name)
-            if ext.lower() == ".json" and base not in EXCLUDE_JSON_BASE:
-                media = search_media(folder, base, edited_word)
-                pairs.append((entry.path, media))
-    return pairs
+            subdirs.append(entry.path)
+            continue
+        base = _sidecar_base(entry)
+        if base is not None:
+            yield entry.path, search_media(index, base, edited_word), index
+    for sub in subdirs:
+        yield from iter_sidecars(sub, edited_word)
+
+
+def _bounded_map(executor, fn, items, window: int):
+    """
+    Like executor.map, but keeps at most `window` tasks in flight so a streamed
+    `items` is never drained into futures up front. Results come back in order.
+    """
+    pending = deque()
+    for args in items:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
 
+def process_folder(root_folder: str, edited_word: str, out_folder: str, workers: Optional[int] = None):
+    total = count_sidecars(root_folder)
+    print("Total JSON sidecars:", total)
 
-def process_folder(root_folder: str, edited_word: str, out_folder: str):
-    sidecars = get_sidecars(root_folder, edited_word)
-    print("Total JSON sidecars:", len(sidecars))
+    # Copies and ExifTool writes block outside the GIL, so threads overlap them
+    workers = workers or (os.cpu_count() or 1) * 2
 
     success = 0
     failed = 0
     linked_live = 0
     seen_live = set()
 
-    for json_path, media_path in progress_bar(sidecars, prefix='Processing', suffix='done.'):
+    # One ExifTool daemon per worker thread, all closed at the end
+    local = threading.local()
+    daemons = []
+    daemons_lock = threading.Lock()
+
+    def get_daemon() -> ExifToolDaemon:
+        et = getattr(local, "et", None)
+        if et is None:
+            et = local.et = ExifToolDaemon().start()
+            with daemons_lock:
+                daemons.append(et)
+        return et
+
+    def plan(json_path: str, media_path: Optional[str], dir_index: DirIndex):
+        """
+        Runs on the main thread in walk order, before the sidecar is handed to a
+        worker: reserves the output names and claims the Live Photo partner, so
+        both come out the same whatever order the workers finish in.
+        Returns the arguments for process_one.
+        """
         if not media_path:
-            print(f"\nMissing media for: {json_path}")
-            failed += 1
-            continue
+            return json_path, None, None, None, None
+
+        # Normalized OUTPUT name for the original bytes
+        out_media = reserve_output_path(root_folder, out_folder, media_path)
+
+        # If current item is an IMAGE, try to link a Live Photo video partner
+        kind = sniff_type(media_path)
+        if kind and kind[0] not in ("mov", "mp4"):
+            # derive base stem from the original media filename
+            stem, _ = os.path.splitext(os.path.basename(media_path))
+            live_path = find_live_video_partner(dir_index, stem)
+            # claim the partner so two images sharing a stem don't both link it
+            if live_path and live_path not in seen_live:
+                seen_live.add(live_path)
+                return json_path, media_path, out_media, live_path, reserve_output_path(root_folder, out_folder, live_path)
+        return json_path, media_path, out_media, None, None
+
+    def process_one(json_path: str, media_path: Optional[str], out_media: Optional[str],
+                    live_path: Optional[str], out_live: Optional[str]):
+        """Returns (success, failed, linked_live, messages) for one planned sidecar."""
+        if not media_path:
+            return 0, 1, 0, [f"Missing media for: {json_path}"]
+
+        et = get_daemon()
+        ok = linked = 0
+        messages = []
+
+        # Copy original bytes to the reserved OUTPUT name
+        fast_copy(media_path, out_media)
 
-        # Copy original bytes to normalized OUTPUT name
-        out_media = copy_media_to_output(root_folder, out_folder, media_path)
-        
         # Extract data
         meta = extract_metadata(json_path)
+        kind = sniff_type(media_path)
+        targets = [out_media]
+        kinds = [kind]
 
-        # Lossless write + always set filesystem timestamps
-        rc, log = apply_metadata_and_fs_times(out_media, meta)
+        if live_path:
+            # copy to normalized output; it gets the same date/gps as the image
+            fast_copy(live_path, out_live)
+            targets.append(out_live)
+            kinds.append(sniff_type(live_path))
+
+        # Lossless write + always set filesystem timestamps, image and video in one round trip
+        results = apply_metadata_and_fs_times(targets, meta, et, kinds)
+
+        rc, log = results[0]
         if rc != 0:
             # We won't stop processing just because the ExifTool write failed
             # (filesystem times were still set via fallback when possible).
-            print(f"\nExifTool write failed for: {out_media}\n{log}")
+            messages.append(f"ExifTool write failed for: {out_media}\n{log}")
         else:
-            success += 1
+            ok = 1
 
+        if live_path:
+            rc2, log2 = results[1]
+            if rc2 != 0:
+                messages.append(f"Live video write failed for: {out_live}\n{log2}")
+            else:
+                linked = 1
 
-        # If current item is an IMAGE, try to link a Live Photo video partner
-        kind = sniff_type(media_path)
-        if kind and kind[0] not in ("mov", "mp4"):
-            # derive base stem from the original media filename
-            stem, _ = os.path.splitext(os.path.basename(media_path))
-            folder = os.path.dirname(media_path)
-            live_path = find_live_video_partner(folder, stem)
-            if live_path and live_path not in seen_live:
-                # copy to normalized output and write date/gps using same meta
-                out_live = copy_media_to_output(root_folder, out_folder, live_path)
-                rc2, log2 = apply_metadata_and_fs_times(out_live, meta)
-                if rc2 != 0:
-                    print(f"\nLive video write failed for: {out_live}\n{log2}")
-                else:
-                    linked_live += 1
-                    seen_live.add(live_path)
+        return ok, 0, linked, messages
 
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            planned = (plan(*item) for item in iter_sidecars(root_folder, edited_word))
+            results = _bounded_map(executor, process_one, planned, workers * 4)
+            for ok, bad, linked, messages in progress_bar(results, total, prefix='Processing', suffix='done.'):
+                for msg in messages:
+                    print(f"\n{msg}")
+                success += ok
+                failed += bad
+                linked_live += linked
+    finally:
+        for et in daemons:
+            et.close()
 
     print("\nLossless metadata merge complete.")
     print("Success:", success)